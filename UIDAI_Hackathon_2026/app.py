@@ -4,6 +4,10 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import os
+import tempfile
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 # ------------------------------------------------------------------------------
 # 1. Page Configuration & Styling
@@ -51,32 +55,182 @@ st.markdown("""
 # ------------------------------------------------------------------------------
 # 2. Data Loading & Cleaning
 # ------------------------------------------------------------------------------
+DATA_CSV = 'final_uidai_data.csv'
+DATA_PARQUET = 'final_uidai_data.parquet'
+# Only the fields the dashboard actually reads
+DATA_COLUMNS = ['month', 'state', 'district', 'total_enrolments', 'demo_update_ratio', 'bio_update_ratio']
+
+def read_csv_data():
+    # Arrow's multithreaded reader with an explicit schema (no dtype inference).
+    # Categorical state/district: equality checks and groupby work on integer codes.
+    return pd.read_csv(
+        DATA_CSV,
+        engine='pyarrow',
+        usecols=DATA_COLUMNS,
+        dtype={
+            'state': 'category',
+            'district': 'category',
+            'demo_update_ratio': np.float32,
+            'bio_update_ratio': np.float32,
+        },
+        parse_dates=['month'],
+    )
+
+def parquet_is_stale():
+    if not os.path.exists(DATA_PARQUET):
+        return True
+    return os.path.exists(DATA_CSV) and os.path.getmtime(DATA_PARQUET) < os.path.getmtime(DATA_CSV)
+
+def write_parquet(df):
+    # Write to a temp file beside the target and swap it in atomically, so a crash
+    # mid-write never leaves a truncated Parquet file that looks fresh
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(DATA_PARQUET)), suffix='.parquet.tmp'
+    )
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, DATA_PARQUET)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 @st.cache_data
 def load_data():
     try:
-        df = pd.read_csv('final_uidai_data.csv')
+        df = None
+        if not parquet_is_stale():
+            try:
+                df = pd.read_parquet(DATA_PARQUET, engine='pyarrow', columns=DATA_COLUMNS)
+            except (OSError, pa.ArrowException):
+                df = None  # Unreadable Parquet copy: rebuild it from the CSV below
+        if df is None:
+            # One-off conversion: later cold starts skip CSV parsing entirely
+            df = read_csv_data()
+            try:
+                write_parquet(df)
+            except OSError:
+                pass  # Read-only deployment: keep serving from the CSV frame
     except FileNotFoundError:
-        st.error("Critical Error: 'final_uidai_data.csv' not found in directory.")
+        st.error(f"Critical Error: '{DATA_CSV}' not found in directory.")
         return None
 
     # 1. Dynamic Stress Calculation
     if 'total_stress_index' not in df.columns:
-        df['total_stress_index'] = df.get('demo_update_ratio', 0) + df.get('bio_update_ratio', 0)
+        # float32 halves the bytes moved by every downstream aggregation
+        demo = df['demo_update_ratio'].to_numpy(dtype=np.float32, copy=False)
+        bio = df['bio_update_ratio'].to_numpy(dtype=np.float32, copy=False)
+        df['total_stress_index'] = np.add(demo, bio)
 
     # 2. Identify High Stress (Top 5%)
     if 'is_high_stress' not in df.columns:
-        if not df['total_stress_index'].empty:
-            threshold = df['total_stress_index'].quantile(0.95)
-            df['is_high_stress'] = df['total_stress_index'] > threshold
+        arr = df['total_stress_index'].to_numpy()
+        # Series.quantile skips NaN, so the threshold is taken over valid values only
+        valid = arr[~np.isnan(arr)]
+        if valid.size:
+            # 95th percentile via partial partition (O(N)) instead of a full sort,
+            # keeping the same linear interpolation as Series.quantile
+            pos = 0.95 * (valid.size - 1)
+            lo = int(pos)
+            hi = min(lo + 1, valid.size - 1)
+            part = np.partition(valid, [lo, hi])
+            threshold = part[lo] + (part[hi] - part[lo]) * (pos - lo)
+            df['is_high_stress'] = arr > threshold
         else:
             df['is_high_stress'] = False
             
     # Ensure month is datetime for trending
     if 'month' in df.columns:
         df['month_dt'] = pd.to_datetime(df['month'])
+        # Dense small-int month codes (categories keep the timestamps for plotting)
+        df['month_cat'] = df['month_dt'].astype('category')
         
     return df
 
+@st.cache_data
+def states_list():
+    # Category labels are already unique and sorted; computed once, reused across reruns
+    return load_data()['state'].cat.categories.tolist()
+
+def groupby_mean(codes, vals, n_groups):
+    """Per-group mean over dense integer codes; returns (means, counts)."""
+    # Skip missing keys (code -1, which bincount rejects) and NaN values, as groupby.mean does;
+    # counts come from the same filtered codes, so all-NaN groups read as unobserved
+    valid = (codes >= 0) & ~np.isnan(vals)
+    codes, vals = codes[valid], vals[valid]
+    # Fused sum/count reduction: two bincount passes instead of pandas' generic groupby
+    sums = np.bincount(codes, weights=vals, minlength=n_groups)
+    counts = np.bincount(codes, minlength=n_groups)
+    return sums / np.maximum(counts, 1), counts
+
+@st.cache_resource
+def per_state_views():
+    # One grouping pass; state filtering then becomes a dict lookup
+    df = load_data()
+    return {state: group for state, group in df.groupby('state', observed=True)}
+
+def filter_data(selected_state, start_date, end_date):
+    """Apply the sidebar filters to the cached master dataset."""
+    df = load_data()
+
+    # State Filter Application
+    if selected_state != "All India":
+        df = per_state_views().get(selected_state, df.iloc[:0])
+
+    # Date Filter Application (on the already-narrowed frame)
+    if 'month_dt' in df.columns:
+        # Compare datetime64 directly against Timestamp bounds (no .dt.date objects)
+        mask = (df['month_dt'] >= pd.Timestamp(start_date)) & (df['month_dt'] <= pd.Timestamp(end_date))
+        df = df.loc[mask]
+
+    return df
+
+# Cached aggregations, keyed on the filter values only (cheap to hash)
+@st.cache_data
+def compute_metrics(selected_state, start_date, end_date):
+    df_filtered = filter_data(selected_state, start_date, end_date)
+    # Count straight off the mask; no high-risk frame is materialised just to size it
+    mask_hs = df_filtered['is_high_stress'].to_numpy()
+
+    # One fused agg call instead of a separate pass per metric
+    stats = df_filtered.agg({
+        'demo_update_ratio': 'mean',
+        'bio_update_ratio': 'mean',
+        'total_enrolments': 'sum',
+    })
+
+    return {
+        'avg_demo': stats['demo_update_ratio'],
+        'avg_bio': stats['bio_update_ratio'],
+        'high_risk_count': int(mask_hs.sum()),
+        'total_enrol': int(stats['total_enrolments']),
+    }
+
+@st.cache_data
+def compute_trend(selected_state, start_date, end_date):
+    df_filtered = filter_data(selected_state, start_date, end_date)
+    if 'month_cat' not in df_filtered.columns or df_filtered.empty:
+        return pd.DataFrame(columns=['month_dt', 'total_stress_index'])
+    # Reduce over month codes rather than hashing 64-bit timestamps per row;
+    # NaN stress values are skipped, as groupby('month_dt').mean() did
+    months = df_filtered['month_cat'].cat
+    means, counts = groupby_mean(
+        months.codes.to_numpy(),
+        df_filtered['total_stress_index'].to_numpy(),
+        len(months.categories),
+    )
+    observed = counts > 0
+    return pd.DataFrame({
+        'month_dt': months.categories[observed],
+        'total_stress_index': means[observed]
+    })
+
+@st.cache_data
+def compute_top(selected_state, start_date, end_date):
+    df_filtered = filter_data(selected_state, start_date, end_date)
+    # Partial sort on the displayed columns only
+    return df_filtered[['district', 'state', 'total_stress_index']].nlargest(10, 'total_stress_index')
+
 df = load_data()
 
 if df is None:
@@ -90,7 +244,7 @@ with st.sidebar:
     st.header("🎛️ Analysis Controls")
     
     # State Filter
-    all_states = sorted(df['state'].astype(str).unique().tolist())
+    all_states = states_list()
     selected_state = st.selectbox("🌍 Filter by Region", ["All India"] + all_states)
     
     # Date Filter
@@ -106,18 +260,6 @@ with st.sidebar:
     st.markdown("---")
     st.info("💡 Adjust filters to drill down into specific regional stress patterns.")
 
-# Applying Filters
-df_filtered = df.copy()
-
-# Date Filter Application
-if 'month_dt' in df_filtered.columns:
-    mask = (df_filtered['month_dt'].dt.date >= start_date) & (df_filtered['month_dt'].dt.date <= end_date)
-    df_filtered = df_filtered.loc[mask]
-
-# State Filter Application
-if selected_state != "All India":
-    df_filtered = df_filtered[df_filtered['state'] == selected_state]
-
 # ------------------------------------------------------------------------------
 # 4. Map Logic (Coordinates Dictionary)
 # ------------------------------------------------------------------------------
@@ -162,31 +304,39 @@ STATE_COORDS = {
     "The Dadra And Nagar Haveli And Daman And Diu": [20.4283, 72.8397]
 }
 
+# Struct-of-arrays view of STATE_COORDS: contiguous float32 lat/lon columns on a
+# categorical index, so row i of COORDS_DF is code i of STATE_DTYPE
+STATE_DTYPE = pd.CategoricalDtype(categories=list(STATE_COORDS.keys()))
+COORDS_DF = pd.DataFrame(STATE_COORDS, index=['lat', 'lon']).T.astype(np.float32)
+COORDS_DF.index = pd.CategoricalIndex(COORDS_DF.index, dtype=STATE_DTYPE)
+
 def create_map_data(dframe):
     # Only map what is in the filtered view
-    state_agg = dframe.groupby('state')['total_stress_index'].mean().reset_index()
-    lat = []
-    lon = []
-    found_states = []
-    stress_vals = []
-    
-    for _, row in state_agg.iterrows():
-        s_name = row['state']
-        coords = STATE_COORDS.get(s_name)
-        if coords:
-            found_states.append(s_name)
-            lat.append(coords[0])
-            lon.append(coords[1])
-            stress_vals.append(row['total_stress_index'])
-    
+    states = dframe['state'].cat
+    means, counts = groupby_mean(
+        states.codes.to_numpy(),
+        dframe['total_stress_index'].to_numpy(),
+        len(states.categories),
+    )
+    observed = counts > 0
+    state_agg = pd.Series(means[observed], index=states.categories[observed])
+
+    # Recode to the coordinate table; states without coordinates get code -1 and drop out
+    codes = STATE_DTYPE.categories.get_indexer(state_agg.index)
+    found = codes >= 0
+    # float32 throughout the map path (COORDS_DF already is) halves the Plotly payload
+    stress_vals = state_agg.to_numpy().astype(np.float32, copy=False)
     return pd.DataFrame({
-        'State': found_states,
-        'lat': lat,
-        'lon': lon,
-        'Average Stress': stress_vals
+        'State': state_agg.index[found],
+        'lat': COORDS_DF['lat'].to_numpy()[codes[found]],
+        'lon': COORDS_DF['lon'].to_numpy()[codes[found]],
+        'Average Stress': stress_vals[found]
     })
 
-map_df = create_map_data(df) # We visualize the Full National Map for context, or you can switch to df_filtered to zoom
+@st.cache_data
+def compute_map():
+    # We visualize the Full National Map for context, so this ignores the filters
+    return create_map_data(load_data())
 
 # ------------------------------------------------------------------------------
 # 5. Header & Warning
@@ -194,22 +344,21 @@ map_df = create_map_data(df) # We visualize the Full National Map for context, o
 title_prefix = f"{selected_state}" if selected_state != "All India" else "National"
 st.markdown(f"<h1 class='main-header'>🇮🇳 UIDAI Identity Stress Monitoring System ({title_prefix})</h1>", unsafe_allow_html=True)
 
-high_risk_districts = df_filtered[df_filtered['is_high_stress']]
-if not high_risk_districts.empty:
-    count = len(high_risk_districts)
-    st.markdown(f"<div class='warning-banner'>⚠️ ALERT: {count} Districts Identified as High Risk in current view</div>", unsafe_allow_html=True)
+# Calculate reactive metrics
+metrics = compute_metrics(selected_state, start_date, end_date)
+avg_demo = metrics['avg_demo']
+avg_bio = metrics['avg_bio']
+high_risk_count = metrics['high_risk_count']
+total_enrol = metrics['total_enrol']
+
+if high_risk_count > 0:
+    st.markdown(f"<div class='warning-banner'>⚠️ ALERT: {high_risk_count} Districts Identified as High Risk in current view</div>", unsafe_allow_html=True)
 
 # ------------------------------------------------------------------------------
 # 6. Zone A: Key Metrics (Reactive)
 # ------------------------------------------------------------------------------
 c1, c2, c3, c4 = st.columns(4)
 
-# Calculate reactive metrics
-avg_demo = df_filtered['demo_update_ratio'].mean()
-avg_bio = df_filtered['bio_update_ratio'].mean()
-high_risk_count = high_risk_districts.shape[0]
-total_enrol = df_filtered['total_enrolments'].sum() if 'total_enrolments' in df.columns else 0
-
 with c1:
     st.metric(label="Avg Demographic Stress", value=f"{avg_demo:.2f}")
 with c2:
@@ -224,57 +373,93 @@ st.divider()
 # ------------------------------------------------------------------------------
 # 7. Zone B (Map) & Zone C (Charts)
 # ------------------------------------------------------------------------------
+# Assembled figures are cached as objects (read-only once built), so reruns
+# with unchanged filters skip trace and layout construction
+@st.cache_resource
+def build_map_fig(selected_state):
+    # The map is national, so only the zoom depends on the filters
+    map_df = compute_map()
+    if map_df.empty:
+        return None
+
+    # Graph objects trace instead of px.scatter_geo: no Express column
+    # resolution / trace splitting; sizing and hover text mirror px (area, size_max=20)
+    # Plain typed arrays go through Plotly's numpy (base64) encoder path
+    lat = map_df['lat'].to_numpy()
+    lon = map_df['lon'].to_numpy()
+    stress = map_df['Average Stress'].to_numpy()
+    fig_map = go.Figure(go.Scattergeo(
+        lat=lat,
+        lon=lon,
+        hovertext=map_df['State'].to_numpy(dtype=str),
+        hovertemplate="<b>%{hovertext}</b><br><br>Average Stress=%{marker.color}<br>lat=%{lat}<br>lon=%{lon}<extra></extra>",
+        mode='markers',
+        marker=dict(
+            size=stress,
+            sizemode='area',
+            sizeref=stress.max() / (20 ** 2),
+            color=stress,
+            colorscale="Reds",
+            showscale=True,
+            colorbar=dict(title="Average Stress"),
+        ),
+    ))
+    
+    # Smart Zoom
+    if selected_state != "All India" and selected_state in COORDS_DF.index:
+        # Zoom into the selected state
+        center_lat = float(COORDS_DF.at[selected_state, 'lat'])
+        center_lon = float(COORDS_DF.at[selected_state, 'lon'])
+        zoom_lat_range = [center_lat - 5, center_lat + 5]
+        zoom_lon_range = [center_lon - 5, center_lon + 5]
+    else:
+        # Default India view
+        center_lat = 22.0
+        center_lon = 82.0
+        zoom_lat_range = [6, 38]
+        zoom_lon_range = [68, 98]
+
+    fig_map.update_geos(
+        visible=False, 
+        resolution=50,
+        showcountries=True, countrycolor="Black",
+        center={"lat": center_lat, "lon": center_lon},
+        lataxis_range=zoom_lat_range, 
+        lonaxis_range=zoom_lon_range
+    )
+    fig_map.update_layout(
+        geo=dict(
+            scope='asia',
+            projection_type='mercator',
+            showland=True,
+            landcolor='rgb(243, 243, 243)',
+            countrycolor='rgb(204, 204, 204)',
+        ),
+        margin={"r":0,"t":10,"l":0,"b":0},
+        height=600
+    )
+    return fig_map
+
+@st.cache_resource
+def build_trend_fig(selected_state, start_date, end_date):
+    trend = compute_trend(selected_state, start_date, end_date)
+    if trend.empty:
+        return None
+    fig_trend = px.line(
+        trend, x='month_dt', y='total_stress_index',
+        markers=True,
+        title=f"Stress Over Time ({selected_state})"
+    )
+    fig_trend.update_layout(xaxis_title="Month", yaxis_title="Stress Index", height=300)
+    return fig_trend
+
 col_left, col_right = st.columns([2, 1])
 
 with col_left:
     st.subheader("📍 Geospatial Stress Heatmap")
     
-    if not map_df.empty:
-        fig_map = px.scatter_geo(
-            map_df,
-            lat='lat',
-            lon='lon',
-            hover_name="State",
-            size="Average Stress",
-            color="Average Stress",
-            color_continuous_scale="Reds",
-            scope="asia", 
-            projection="natural earth"
-        )
-        
-        # Smart Zoom
-        if selected_state != "All India" and selected_state in STATE_COORDS:
-            # Zoom into the selected state
-            center_lat = STATE_COORDS[selected_state][0]
-            center_lon = STATE_COORDS[selected_state][1]
-            zoom_lat_range = [center_lat - 5, center_lat + 5]
-            zoom_lon_range = [center_lon - 5, center_lon + 5]
-        else:
-            # Default India view
-            center_lat = 22.0
-            center_lon = 82.0
-            zoom_lat_range = [6, 38]
-            zoom_lon_range = [68, 98]
-
-        fig_map.update_geos(
-            visible=False, 
-            resolution=50,
-            showcountries=True, countrycolor="Black",
-            center={"lat": center_lat, "lon": center_lon},
-            lataxis_range=zoom_lat_range, 
-            lonaxis_range=zoom_lon_range
-        )
-        fig_map.update_layout(
-            geo=dict(
-                scope='asia',
-                projection_type='mercator',
-                showland=True,
-                landcolor='rgb(243, 243, 243)',
-                countrycolor='rgb(204, 204, 204)',
-            ),
-            margin={"r":0,"t":10,"l":0,"b":0},
-            height=600
-        )
+    fig_map = build_map_fig(selected_state)
+    if fig_map is not None:
         st.plotly_chart(fig_map, use_container_width=True)
     else:
         st.warning("No geospatial data available.")
@@ -282,26 +467,20 @@ with col_left:
 with col_right:
     # 1. Trend Chart (Reactive)
     st.subheader("📈 Stress Trend")
-    if 'month_dt' in df_filtered.columns and not df_filtered.empty:
-        trend = df_filtered.groupby('month_dt')['total_stress_index'].mean().reset_index()
-        fig_trend = px.line(
-            trend, x='month_dt', y='total_stress_index',
-            markers=True,
-            title=f"Stress Over Time ({selected_state})"
-        )
-        fig_trend.update_layout(xaxis_title="Month", yaxis_title="Stress Index", height=300)
+    fig_trend = build_trend_fig(selected_state, start_date, end_date)
+    if fig_trend is not None:
         st.plotly_chart(fig_trend, use_container_width=True)
     else:
         st.info("No trend data available for current selection.")
 
     # 2. Top Districts (Reactive)
     st.subheader(f"🚨 Top High-Stress Districts ({selected_state})")
-    if not df_filtered.empty:
-        # Sort by total stress
-        top_5 = df_filtered.sort_values(by='total_stress_index', ascending=False).head(10)
+    # Sort by total stress
+    top_5 = compute_top(selected_state, start_date, end_date)
+    if not top_5.empty:
         
         st.dataframe(
-            top_5[['district', 'state', 'total_stress_index']],
+            top_5,
             hide_index=True,
             use_container_width=True,
             column_config={
@@ -313,7 +492,12 @@ with col_right:
         )
         
         # Download Button for Hackathon Value
-        csv_data = top_5.to_csv(index=False).encode('utf-8')
+        # Arrow's writer emits UTF-8 bytes directly (no intermediate Python str)
+        buf = pa.BufferOutputStream()
+        # Export the score as float64 at display precision, not raw float32 digits
+        export = top_5.astype({'total_stress_index': np.float64}).round({'total_stress_index': 2})
+        pacsv.write_csv(pa.Table.from_pandas(export, preserve_index=False), buf)
+        csv_data = bytes(buf.getvalue())
         st.download_button(
             label="📥 Download Priority List",
             data=csv_data,